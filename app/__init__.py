@@ -0,0 +1,8 @@
+"""
+Action Board application package
+"""
+
+import time
+
+# Reference point of cold-start time, taken before any application import
+STARTED_AT = time.perf_counter()
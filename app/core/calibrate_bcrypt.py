@@ -0,0 +1,110 @@
+"""
+This module contains the bcrypt cost calibration command
+
+It benchmarks bcrypt verification on the host and picks the highest
+cost whose verify latency stays under the target:
+
+    python -m app.core.calibrate_bcrypt --target-ms 250 [--env-file .env]
+
+Selected cost is stored as BCRYPT_ROUNDS setting, existing passwords
+are rehashed with it on next login
+"""
+
+import argparse
+import statistics
+import time
+from passlib.hash import bcrypt
+from app.core.constants import BCRYPT_MIN_ROUNDS, BCRYPT_MAX_ROUNDS
+
+def measure_verify_ms(rounds: int, samples: int = 5) -> float:
+    """
+    Returns median bcrypt verify latency in milliseconds for a given cost
+    """
+    password = "calibration-password"
+    hashed = bcrypt.using(rounds=rounds).hash(password)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        bcrypt.verify(password, hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def calibrate(target_ms: float, min_rounds: int, samples: int = 5) -> int:
+    """
+    Find the highest bcrypt cost meeting the target verify latency
+
+    Args:
+        target_ms (float): Maximum verify latency in milliseconds
+        min_rounds (int): Lowest cost accepted, returned even if too slow
+        samples (int): Number of verifications measured per cost
+
+    Returns:
+        int: Selected bcrypt cost
+    """
+    selected = min_rounds
+    for rounds in range(min_rounds, BCRYPT_MAX_ROUNDS + 1):
+        latency = measure_verify_ms(rounds, samples)
+        print(f"rounds={rounds:>2}  verify={latency:8.1f} ms")
+        if latency > target_ms:
+            break
+        selected = rounds
+        # Each additional round doubles the cost, stop before overshooting
+        if latency * 2 > target_ms:
+            break
+    return selected
+
+def _env_key(line: str) -> str | None:
+    """
+    Returns the key assigned by a dotenv line, also in `export KEY = value` form
+    """
+    name, sep, _ = line.partition("=")
+    if not sep:
+        return None
+    name = name.strip()
+    if name.startswith("export "):
+        name = name[len("export "):].strip()
+    return name
+
+def write_env_setting(env_file: str, key: str, value: str) -> None:
+    """
+    Set (or replace) a setting in a dotenv file
+    """
+    try:
+        with open(env_file, encoding="utf-8") as file:
+            lines = file.read().splitlines()
+    except FileNotFoundError:
+        lines = []
+
+    lines = [line for line in lines if _env_key(line) != key]
+    lines.append(f"{key}={value}")
+
+    with open(env_file, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+
+def main() -> None:
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Calibrate bcrypt cost for this host")
+    parser.add_argument("--target-ms", type=float, default=250,
+                        help="target password verify latency in milliseconds")
+    parser.add_argument("--min-rounds", type=int, default=10,
+                        help="lowest cost accepted whatever the latency")
+    parser.add_argument("--samples", type=int, default=5,
+                        help="verifications measured per cost")
+    parser.add_argument("--env-file",
+                        help="dotenv file where BCRYPT_ROUNDS is written")
+    args = parser.parse_args()
+
+    if not BCRYPT_MIN_ROUNDS <= args.min_rounds <= BCRYPT_MAX_ROUNDS:
+        parser.error(f"--min-rounds must be between {BCRYPT_MIN_ROUNDS} and {BCRYPT_MAX_ROUNDS}")
+
+    rounds = calibrate(args.target_ms, args.min_rounds, args.samples)
+    print(f"BCRYPT_ROUNDS={rounds}")
+
+    if args.env_file:
+        write_env_setting(args.env_file, "BCRYPT_ROUNDS", str(rounds))
+        print(f"Written to {args.env_file}")
+
+if __name__ == "__main__":
+    main()
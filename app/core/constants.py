@@ -0,0 +1,7 @@
+"""
+This module contains constants shared by the application and its commands
+"""
+
+# bcrypt cost factor bounds
+BCRYPT_MIN_ROUNDS = 4
+BCRYPT_MAX_ROUNDS = 31
@@ -0,0 +1,56 @@
+"""
+This module contains worker readiness helpers shared by the application
+lifespan and the readiness probe
+"""
+
+import asyncio
+import os
+from fastapi import FastAPI
+from dotenv import load_dotenv
+from app.db.database import ping_db, warm_up_pool
+from app.db.redis import redis_client
+
+load_dotenv()
+
+HEALTHCHECK_TIMEOUT = float(os.getenv("HEALTHCHECK_TIMEOUT", "2"))
+
+async def warm_up(app: FastAPI) -> bool:
+    """
+    Warm up database connection pool and Redis connection
+    Marks the worker as ready on success
+
+    Failures are logged and not raised, so that an unreachable dependency
+    keeps the worker out of rotation (see /readyz) instead of crashing it
+
+    Returns:
+        bool: Whether the worker is ready
+    """
+    try:
+        await asyncio.wait_for(warm_up_pool(), timeout=HEALTHCHECK_TIMEOUT)
+        if redis_client is not None:
+            await asyncio.wait_for(redis_client.ping(), timeout=HEALTHCHECK_TIMEOUT)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        print(f"Warm-up failed, worker not ready: {exc!r}")
+        return False
+
+    app.state.ready = True
+    return True
+
+async def check_database() -> bool:
+    """
+    Whether the database answers within HEALTHCHECK_TIMEOUT
+    """
+    try:
+        await asyncio.wait_for(ping_db(), timeout=HEALTHCHECK_TIMEOUT)
+        return True
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+
+async def check_redis() -> bool:
+    """
+    Whether Redis answers within HEALTHCHECK_TIMEOUT
+    """
+    try:
+        return bool(await asyncio.wait_for(redis_client.ping(), timeout=HEALTHCHECK_TIMEOUT))
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
@@ -7,14 +7,29 @@ import os
 import jwt
 from passlib.context import CryptContext
 from dotenv import load_dotenv
+from app.core.constants import BCRYPT_MIN_ROUNDS, BCRYPT_MAX_ROUNDS
 
 load_dotenv()
 
 SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 ALGORITHM=os.getenv("JWT_ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRES_MINUTES"))
+# Calibrate for the host with `python -m app.core.calibrate_bcrypt`
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+if not BCRYPT_MIN_ROUNDS <= BCRYPT_ROUNDS <= BCRYPT_MAX_ROUNDS:
+    raise ValueError(
+        f"BCRYPT_ROUNDS must be between {BCRYPT_MIN_ROUNDS} and {BCRYPT_MAX_ROUNDS}, "
+        f"got {BCRYPT_ROUNDS}"
+    )
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes using any other cost are flagged by needs_update and rehashed at login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS
+)
 
 def hash_password(password: str) -> str:
     """
@@ -28,6 +43,17 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Checks if password corresponds to its hash
+    Also returns a new hash when the stored one does not use current
+    bcrypt cost (BCRYPT_ROUNDS), None otherwise
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def create_access_token(
     data: dict,
     expires_delta: timedelta | None = None
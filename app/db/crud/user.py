@@ -42,6 +42,18 @@ async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
+async def update_user_password_hash(
+    db: AsyncSession,
+    user: User,
+    hashed_password: str
+) -> User:
+    """
+    Replaces stored password hash of a user
+    """
+    user.hashed_password = hashed_password
+    await db.commit()
+    return user
+
 async def get_users(db: AsyncSession):
     """
     Gets all users
@@ -3,7 +3,9 @@ This module handles SQLAlchemy database connexion configuration
 """
 
 from typing import AsyncGenerator
+import asyncio
 import os
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, DeclarativeMeta
 from dotenv import load_dotenv
@@ -11,8 +13,20 @@ from dotenv import load_dotenv
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Per process pool sizing, the production runner (app/gunicorn_conf.py)
+# derives them from POSTGRES_MAX_CONNECTIONS and the number of workers
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# Logs every SQL statement, for debugging only
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() in ("1", "true", "yes")
 
-engine = create_async_engine(DATABASE_URL, future=True, echo=True)
+engine = create_async_engine(
+    DATABASE_URL,
+    future=True,
+    echo=DB_ECHO,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW
+)
 
 async_session_maker = sessionmaker(
 	bind=engine,
@@ -25,3 +39,18 @@ Base: DeclarativeMeta = declarative_base()
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
+
+async def ping_db() -> None:
+    """
+    Check that the database is reachable
+    Raises an exception if it is not
+    """
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+async def warm_up_pool() -> None:
+    """
+    Open the pool's persistent connections ahead of the first requests
+    so that they don't pay for connection establishment
+    """
+    await asyncio.gather(*(ping_db() for _ in range(engine.pool.size())))
@@ -0,0 +1,27 @@
+"""
+This module handles database schema initialisation
+
+It is meant to be run once per deployment, before application workers
+are started, instead of at every worker startup:
+
+    python -m app.db.init_db
+"""
+
+import asyncio
+from app.db.database import engine, Base
+# Models must be imported so that their tables are registered on Base.metadata
+from app.db.models.user import User  # pylint: disable=unused-import
+from app.db.models.action import Action  # pylint: disable=unused-import
+
+async def init_db() -> None:
+    """
+    Create all database tables that do not exist yet
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+if __name__ == "__main__":
+    print("Initialising Action Board database schema...")
+    asyncio.run(init_db())
+    print("Database schema is up to date")
@@ -0,0 +1,51 @@
+"""
+This module computes database pool sizing for multi-worker deployments
+"""
+
+def pool_settings(
+    workers: int,
+    max_connections: int,
+    reserved_connections: int,
+    pool_size: int | None = None,
+    max_overflow: int | None = None
+) -> tuple[int, int]:
+    """
+    Split Postgres connections between workers so that the pools of all
+    workers stay under max_connections
+
+    Args:
+        workers (int): Number of worker processes
+        max_connections (int): Postgres `max_connections`
+        reserved_connections (int): Connections left for other clients
+        pool_size (int | None): Explicit pool size of each worker
+        max_overflow (int | None): Explicit pool overflow of each worker
+
+    Returns:
+        tuple[int, int]: Pool size and max overflow of each worker,
+        explicit values are returned as is when they fit the budget
+
+    Raises:
+        RuntimeError: When workers count or explicit values do not fit
+    """
+    if workers < 1:
+        raise RuntimeError(f"Workers count must be at least 1, got {workers}")
+
+    connections_per_worker = (max_connections - reserved_connections) // workers
+    if connections_per_worker < 1:
+        raise RuntimeError(
+            f"{workers} workers cannot share {max_connections} Postgres connections "
+            f"({reserved_connections} reserved), lower WEB_CONCURRENCY"
+        )
+
+    if pool_size is None:
+        pool_size = min(5, connections_per_worker)
+    if max_overflow is None:
+        max_overflow = max(0, min(10, connections_per_worker - pool_size))
+
+    if pool_size + max_overflow > connections_per_worker:
+        raise RuntimeError(
+            f"DB_POOL_SIZE + DB_MAX_OVERFLOW must not exceed {connections_per_worker} "
+            f"with {workers} workers and POSTGRES_MAX_CONNECTIONS={max_connections}"
+        )
+
+    return pool_size, max_overflow
@@ -0,0 +1,18 @@
+"""
+This module handles Redis connexion configuration
+"""
+
+import os
+from redis.asyncio import Redis
+from dotenv import load_dotenv
+
+load_dotenv()
+
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_TIMEOUT = float(os.getenv("REDIS_TIMEOUT", "2"))
+
+redis_client: Redis | None = Redis.from_url(
+    REDIS_URL,
+    socket_timeout=REDIS_TIMEOUT,
+    socket_connect_timeout=REDIS_TIMEOUT
+) if REDIS_URL else None
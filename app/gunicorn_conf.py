@@ -0,0 +1,67 @@
+"""
+This module is the gunicorn configuration of the production runner
+
+    gunicorn app.main:app -c app/gunicorn_conf.py
+
+- Application is imported once in the master process, then forked
+  into WEB_CONCURRENCY workers (defaults to the CPUs this process may
+  run on). CPU quotas (e.g. `docker run --cpus`) are not detected,
+  set WEB_CONCURRENCY explicitly in that case
+- Database pool size of each worker is bounded so that the connections
+  of all workers stay under POSTGRES_MAX_CONNECTIONS
+- Access logging is enabled with ACCESS_LOG environment variable
+- Server settings are read from GUNICORN_* environment variables
+  (GUNICORN_BIND, GUNICORN_LOG_LEVEL, GUNICORN_TIMEOUT...)
+"""
+
+import multiprocessing
+import os
+import sys
+from dotenv import load_dotenv
+
+# Config is loaded before gunicorn applies --chdir, make the project root
+# importable whatever directory gunicorn is started from
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from app.db.pool import pool_settings  # pylint: disable=wrong-import-position
+
+load_dotenv()
+
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS and Windows
+        return multiprocessing.cpu_count()
+
+workers = int(os.getenv("WEB_CONCURRENCY", str(_available_cpus())))
+worker_class = "app.worker.UvicornWorker"
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+preload_app = True
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+accesslog = "-" if os.getenv("ACCESS_LOG", "false").lower() in ("1", "true", "yes") else None
+errorlog = "-"
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+keepalive = int(os.getenv("GUNICORN_KEEP_ALIVE", "5"))
+
+# Set before the application (and its engine) is preloaded
+DB_POOL_SIZE, DB_MAX_OVERFLOW = pool_settings(
+    workers=workers,
+    max_connections=int(os.getenv("POSTGRES_MAX_CONNECTIONS", "100")),
+    # Connections left for other clients (superuser, db init, psql sessions...)
+    reserved_connections=int(os.getenv("DB_RESERVED_CONNECTIONS", "10")),
+    pool_size=int(os.environ["DB_POOL_SIZE"]) if "DB_POOL_SIZE" in os.environ else None,
+    max_overflow=int(os.environ["DB_MAX_OVERFLOW"]) if "DB_MAX_OVERFLOW" in os.environ else None
+)
+os.environ["DB_POOL_SIZE"] = str(DB_POOL_SIZE)
+os.environ["DB_MAX_OVERFLOW"] = str(DB_MAX_OVERFLOW)
+
+def post_fork(server, worker):  # pylint: disable=unused-argument
+    """
+    Drop any pooled connection inherited from the master process,
+    each worker must open its own connections
+    """
+    from app.db.database import engine  # pylint: disable=import-outside-toplevel
+    engine.sync_engine.dispose(close=False)
@@ -1,27 +1,48 @@
 """
 This module is an entry point of the Action Board FastAPI
+
+Database schema is not created here, run `python -m app.db.init_db`
+once per deployment before starting the application workers
 """
 
+import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.db.database import engine, Base
+from app import STARTED_AT
+from app.core.readiness import warm_up
+from app.db.database import engine
+from app.db.redis import redis_client
 from app.routes.user import router as user_router
 from app.routes.auth import router as auth_router
 from app.routes.action import router as action_router
+from app.routes.health import router as health_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Handle application lifecycles
+    - Warm up database connection pool and Redis connection at startup,
+      a failed warm-up leaves the worker not ready instead of stopping it
+    - Release connections when stopping application
     """
     print("Starting Action Board application...")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield # here cleanup when stopping application
+    app.state.ready = False
+    app.state.startup_seconds = None
+    app.state.recovered = False
+    if await warm_up(app):
+        # Cold start: from first import of the app package to ready worker
+        app.state.startup_seconds = round(time.perf_counter() - STARTED_AT, 3)
+        print(f"Application ready in {app.state.startup_seconds}s")
+    yield
     print("Stopping application...")
+    app.state.ready = False
+    if redis_client is not None:
+        await redis_client.aclose()
+    await engine.dispose()
 
 app = FastAPI(title="Action Board API", lifespan=lifespan)
 
+app.include_router(health_router)
 app.include_router(user_router, prefix="/api", tags=["Users"])
 app.include_router(auth_router)
 app.include_router(action_router)
@@ -4,15 +4,17 @@ This module contains authentication routes
 
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
 from app.db.models.user import User
-from app.db.crud.user import get_user_by_username
+from app.db.crud.user import get_user_by_username, update_user_password_hash
 from app.schemas.auth import Token
 from app.schemas.user import UserResponse
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_and_update_password, create_access_token
 from app.core.dependencies import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -24,17 +26,36 @@ async def login(
 ) -> Token:
     """
     Authenticate user and return JWT token
+    Password is transparently rehashed when stored hash uses another bcrypt cost,
+    failing to store the new hash does not prevent login
     """
     user: User | None = await get_user_by_username(db, user_data.username)
 
-    if user is None or not verify_password(user_data.password, user.hashed_password):
+    is_valid, new_hash = False, None
+    if user is not None:
+        # bcrypt is CPU bound, keep it off the event loop
+        is_valid, new_hash = await run_in_threadpool(
+            verify_and_update_password, user_data.password, user.hashed_password
+        )
+
+    if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
         )
 
+    # Read before a possible rollback, which expires the user instance
+    username = user.username
+
+    if new_hash is not None:
+        try:
+            await update_user_password_hash(db, user, new_hash)
+        except SQLAlchemyError as exc:
+            await db.rollback()
+            print(f"Password rehash failed for user {username}: {exc!r}")
+
     access_token = create_access_token(
-        data={"sub": user.username},
+        data={"sub": username},
         expires_delta=timedelta(minutes=30)
     )
 
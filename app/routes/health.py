@@ -0,0 +1,54 @@
+"""
+This module contains liveness and readiness probe routes
+"""
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+from app.core.readiness import warm_up, check_database, check_redis
+from app.db.redis import redis_client
+
+router = APIRouter(tags=["Health"])
+
+@router.get("/healthz")
+async def liveness() -> dict:
+    """
+    Liveness probe
+    Only tells that the worker process is up and serving requests
+    """
+    return {"status": "ok"}
+
+@router.get("/readyz")
+async def readiness(request: Request) -> JSONResponse:
+    """
+    Readiness probe
+    - Worker is ready once its warm-up has succeeded, it is retried here
+      when it failed at startup
+    - Database and Redis must answer within HEALTHCHECK_TIMEOUT
+
+    `startup_seconds` is the worker cold-start time, from the import of the
+    app package to the end of a successful warm-up at startup. It stays None
+    when startup warm-up failed, `recovered` then tells whether a later
+    retry from this probe succeeded
+
+    Returns 503 HTTP error when worker is not ready to serve traffic
+    """
+    app = request.app
+    if not app.state.ready and await warm_up(app):
+        app.state.recovered = True
+        print("Application recovered, worker ready")
+
+    checks = {"startup": app.state.ready}
+    checks["database"] = await check_database()
+    if redis_client is not None:
+        checks["redis"] = await check_redis()
+
+    ready = all(checks.values())
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "status": "ready" if ready else "not ready",
+            "checks": checks,
+            "startup_seconds": app.state.startup_seconds,
+            "recovered": app.state.recovered
+        }
+    )
@@ -0,0 +1,16 @@
+"""
+This module contains the uvicorn worker class used by the production runner
+"""
+
+from uvicorn_worker import UvicornWorker as BaseUvicornWorker
+
+class UvicornWorker(BaseUvicornWorker):
+    """
+    Uvicorn worker running on uvloop event loop with httptools HTTP parser
+    Access logging follows gunicorn `accesslog` setting (app/gunicorn_conf.py)
+    """
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "lifespan": "on"
+    }
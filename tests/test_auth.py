@@ -0,0 +1,107 @@
+"""
+Tests for password rehashing at login
+"""
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from fastapi.testclient import TestClient
+from passlib.hash import bcrypt
+
+from app.main import app
+from app.db.database import get_db
+from app.db.models.user import User
+from app.core.security import BCRYPT_ROUNDS, hash_password
+import app.routes.auth as auth_routes
+
+class FakeSession:
+    """
+    Stands in for AsyncSession, only records commits and rollbacks
+    """
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+        self.commit_error = None
+
+    async def commit(self):
+        if self.commit_error is not None:
+            raise self.commit_error
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+@pytest.fixture
+def session():
+    fake_session = FakeSession()
+
+    async def override_get_db():
+        yield fake_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield fake_session
+    app.dependency_overrides.clear()
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+def login_as(monkeypatch, client, user, password):
+    async def fake_get_user_by_username(db, username):
+        return user if username == user.username else None
+
+    monkeypatch.setattr(auth_routes, "get_user_by_username", fake_get_user_by_username)
+    return client.post("/auth/login", data={"username": user.username, "password": password})
+
+def test_login_rehashes_password_with_other_cost(monkeypatch, client, session):
+    old_hash = bcrypt.using(rounds=BCRYPT_ROUNDS - 1).hash("secret")
+    user = User(id=1, username="alice", hashed_password=old_hash, is_admin=False)
+
+    response = login_as(monkeypatch, client, user, "secret")
+
+    assert response.status_code == 200
+    assert session.commits == 1
+    assert user.hashed_password != old_hash
+    assert bcrypt.from_string(user.hashed_password).rounds == BCRYPT_ROUNDS
+    assert bcrypt.verify("secret", user.hashed_password)
+
+def test_login_keeps_hash_with_current_cost(monkeypatch, client, session):
+    current_hash = hash_password("secret")
+    user = User(id=1, username="alice", hashed_password=current_hash, is_admin=False)
+
+    response = login_as(monkeypatch, client, user, "secret")
+
+    assert response.status_code == 200
+    assert session.commits == 0
+    assert user.hashed_password == current_hash
+
+def test_login_wrong_password_does_not_rehash(monkeypatch, client, session):
+    old_hash = bcrypt.using(rounds=BCRYPT_ROUNDS - 1).hash("secret")
+    user = User(id=1, username="alice", hashed_password=old_hash, is_admin=False)
+
+    response = login_as(monkeypatch, client, user, "wrong")
+
+    assert response.status_code == 401
+    assert session.commits == 0
+    assert user.hashed_password == old_hash
+
+def test_login_succeeds_when_rehash_cannot_be_stored(monkeypatch, client, session):
+    old_hash = bcrypt.using(rounds=BCRYPT_ROUNDS - 1).hash("secret")
+    user = User(id=1, username="alice", hashed_password=old_hash, is_admin=False)
+    session.commit_error = OperationalError("UPDATE users", {}, Exception("connection lost"))
+
+    response = login_as(monkeypatch, client, user, "secret")
+
+    assert response.status_code == 200
+    assert response.json()["token_type"] == "bearer"
+    assert session.rollbacks == 1
+
+def test_login_unknown_user(monkeypatch, client, session):
+    async def fake_get_user_by_username(db, username):
+        return None
+
+    monkeypatch.setattr(auth_routes, "get_user_by_username", fake_get_user_by_username)
+
+    response = client.post("/auth/login", data={"username": "bob", "password": "secret"})
+
+    assert response.status_code == 401
+    assert session.commits == 0
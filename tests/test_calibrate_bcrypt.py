@@ -0,0 +1,53 @@
+"""
+Tests for bcrypt cost calibration command
+"""
+
+import app.core.calibrate_bcrypt as calibrate_bcrypt
+from app.core.calibrate_bcrypt import calibrate, write_env_setting
+
+def fake_measure_verify_ms(rounds: int, samples: int = 5) -> float:
+    # 100 ms at cost 10, doubling with each round
+    return 100 * 2 ** (rounds - 10)
+
+def test_calibrate_picks_highest_cost_under_target(monkeypatch):
+    monkeypatch.setattr(calibrate_bcrypt, "measure_verify_ms", fake_measure_verify_ms)
+    assert calibrate(target_ms=250, min_rounds=4) == 11
+    assert calibrate(target_ms=400, min_rounds=4) == 12
+
+def test_calibrate_never_goes_below_min_rounds(monkeypatch):
+    monkeypatch.setattr(calibrate_bcrypt, "measure_verify_ms", fake_measure_verify_ms)
+    assert calibrate(target_ms=10, min_rounds=10) == 10
+
+def test_calibrate_stops_measuring_once_next_cost_is_too_slow(monkeypatch):
+    measured = []
+
+    def measure(rounds, samples=5):
+        measured.append(rounds)
+        return fake_measure_verify_ms(rounds)
+
+    monkeypatch.setattr(calibrate_bcrypt, "measure_verify_ms", measure)
+    calibrate(target_ms=250, min_rounds=10)
+    assert measured == [10, 11]
+
+def test_write_env_setting_replaces_existing_forms(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "JWT_ALGORITHM=HS256\n"
+        "BCRYPT_ROUNDS=12\n"
+        "export BCRYPT_ROUNDS=13\n"
+        "  BCRYPT_ROUNDS = 14\n"
+        "BCRYPT_ROUNDS_NOTE=keep\n"
+    )
+
+    write_env_setting(str(env_file), "BCRYPT_ROUNDS", "11")
+
+    assert env_file.read_text().splitlines() == [
+        "JWT_ALGORITHM=HS256",
+        "BCRYPT_ROUNDS_NOTE=keep",
+        "BCRYPT_ROUNDS=11",
+    ]
+
+def test_write_env_setting_creates_file(tmp_path):
+    env_file = tmp_path / ".env"
+    write_env_setting(str(env_file), "BCRYPT_ROUNDS", "11")
+    assert env_file.read_text() == "BCRYPT_ROUNDS=11\n"
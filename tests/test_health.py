@@ -0,0 +1,114 @@
+"""
+Tests for liveness and readiness probes
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.db.database import Base
+import app.core.readiness as readiness
+import app.routes.health as health_routes
+
+class FakeDependency:
+    """
+    Stands in for an async dependency check that can be switched up or down
+    """
+    def __init__(self):
+        self.up = False
+        self.calls = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.calls += 1
+        if not self.up:
+            raise ConnectionRefusedError("unreachable")
+        return True
+
+class FakeRedis:
+    """
+    Stands in for the Redis client, only answers ping
+    """
+    def __init__(self):
+        self.ping = FakeDependency()
+
+@pytest.fixture
+def database(monkeypatch):
+    fake_database = FakeDependency()
+    monkeypatch.setattr(readiness, "ping_db", fake_database)
+    monkeypatch.setattr(readiness, "warm_up_pool", fake_database)
+    return fake_database
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake_redis = FakeRedis()
+    monkeypatch.setattr(readiness, "redis_client", fake_redis)
+    monkeypatch.setattr(health_routes, "redis_client", fake_redis)
+    return fake_redis
+
+def test_lifespan_does_not_create_schema(monkeypatch, database):
+    def fail_create_all(*args, **kwargs):
+        raise AssertionError("create_all must not run at worker startup")
+
+    monkeypatch.setattr(Base.metadata, "create_all", fail_create_all)
+    database.up = True
+
+    with TestClient(app) as client:
+        assert client.get("/healthz").status_code == 200
+
+def test_healthz_when_database_unreachable(database):
+    with TestClient(app) as client:
+        response = client.get("/healthz")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+def test_readyz_when_warm_up_fails(database, redis):
+    with TestClient(app) as client:
+        response = client.get("/readyz")
+
+    assert response.status_code == 503
+    body = response.json()
+    assert body["checks"] == {"startup": False, "database": False, "redis": False}
+    assert body["startup_seconds"] is None
+    assert body["recovered"] is False
+
+def test_readyz_recovers_once_dependencies_are_back(database, redis):
+    with TestClient(app) as client:
+        assert client.get("/readyz").status_code == 503
+
+        database.up = True
+        redis.ping.up = True
+        response = client.get("/readyz")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["checks"] == {"startup": True, "database": True, "redis": True}
+    # Outage is not reported as cold-start time
+    assert body["startup_seconds"] is None
+    assert body["recovered"] is True
+
+def test_readyz_when_ready_at_startup(database, redis):
+    database.up = True
+    redis.ping.up = True
+
+    with TestClient(app) as client:
+        warm_up_calls = database.calls
+        response = client.get("/readyz")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["startup_seconds"] > 0
+    assert body["recovered"] is False
+    # Warm-up is not retried once ready, only the database check runs
+    assert database.calls == warm_up_calls + 1
+
+def test_readyz_when_redis_fails(database, redis):
+    database.up = True
+    redis.ping.up = True
+
+    with TestClient(app) as client:
+        redis.ping.up = False
+        response = client.get("/readyz")
+
+    assert response.status_code == 503
+    assert response.json()["checks"] == {"startup": True, "database": True, "redis": False}
@@ -0,0 +1,41 @@
+"""
+Tests for database pool sizing across workers
+"""
+
+import pytest
+from app.db.pool import pool_settings
+
+def test_defaults_when_budget_allows():
+    assert pool_settings(workers=4, max_connections=100, reserved_connections=10) == (5, 10)
+
+def test_defaults_shrink_to_fit_budget():
+    # (100 - 10) // 16 = 5 connections per worker
+    assert pool_settings(workers=16, max_connections=100, reserved_connections=10) == (5, 0)
+    # (100 - 10) // 30 = 3 connections per worker
+    assert pool_settings(workers=30, max_connections=100, reserved_connections=10) == (3, 0)
+
+@pytest.mark.parametrize("workers", [1, 2, 8, 32, 90])
+def test_total_connections_stay_under_max(workers):
+    pool_size, max_overflow = pool_settings(
+        workers=workers, max_connections=100, reserved_connections=10
+    )
+    assert workers * (pool_size + max_overflow) <= 100 - 10
+
+def test_explicit_values_are_kept():
+    assert pool_settings(
+        workers=2, max_connections=100, reserved_connections=10, pool_size=20, max_overflow=5
+    ) == (20, 5)
+
+def test_explicit_values_over_budget_are_rejected():
+    with pytest.raises(RuntimeError, match="must not exceed 11"):
+        pool_settings(
+            workers=8, max_connections=100, reserved_connections=10, pool_size=10, max_overflow=5
+        )
+
+def test_too_many_workers_are_rejected():
+    with pytest.raises(RuntimeError, match="cannot share"):
+        pool_settings(workers=91, max_connections=100, reserved_connections=10)
+
+def test_zero_workers_are_rejected():
+    with pytest.raises(RuntimeError, match="at least 1"):
+        pool_settings(workers=0, max_connections=100, reserved_connections=10)